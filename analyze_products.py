@@ -22,11 +22,6 @@ output_directory = os.getenv("OUTPUT_DIRECTORY")
 revenue_filenames = get_combined_revenue_files_in_directory(output_directory)
 with tqdm.tqdm(total=len(revenue_filenames)) as progress_bar:
     for revenue_filename in revenue_filenames:
-        progress_bar.set_description(
-            f"Reading products from {revenue_filename}")
-        features_dataframe = pd.read_parquet(
-            revenue_filename, engine="pyarrow")
-
         supermarket_name = get_supermarket_name(revenue_filename)
 
         data_directory = os.path.join(output_directory, supermarket_name)
@@ -38,6 +33,13 @@ with tqdm.tqdm(total=len(revenue_filenames)) as progress_bar:
                                            plot_directory=supermarket_plot_directory,
                                            supermarket_name=supermarket_name,
                                            coicop_level_columns=Constants.COICOP_LEVELS_COLUMNS)
+
+        progress_bar.set_description(
+            f"Reading products from {revenue_filename}")
+        # Only read the columns used by the analysis
+        features_dataframe = pd.read_parquet(
+            revenue_filename, engine="pyarrow", columns=product_analysis.columns, memory_map=True)
+
         progress_bar.set_description(
             f"Analyzing products from {revenue_filename}, storing plots in {supermarket_plot_directory}, storing tables in {data_directory}")
         product_analysis.analyze_products(features_dataframe)
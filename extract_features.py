@@ -43,7 +43,7 @@ for combined_revenue_file in get_combined_revenue_files_in_directory(output_dire
 
     print(f"Extracting features from {combined_revenue_file}")
     revenue_dataframe = pd.read_parquet(
-        combined_revenue_file, engine="pyarrow")
+        combined_revenue_file, engine="pyarrow", memory_map=True)
     supermarket_name = get_supermarket_name(combined_revenue_file)
     feature_extractor_factory.extract_all_features_and_save(
         dataframe=revenue_dataframe,
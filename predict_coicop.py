@@ -1,7 +1,6 @@
 from ssi.coicop_json_parser import load_input_file
 from ssi.coicop_pipeline import CoicopPipeline
 import argparse
-import json
 # Adapted from https://huggingface.co/scikit-learn/sklearn-transformers/blob/main/pipeline.py
 
 def main(args):
@@ -10,9 +9,10 @@ def main(args):
         coicop_input_file = load_input_file(args.input_data)
         coicop_output_file = pipeline.predict_receipt(coicop_input_file)
 
-        with open(args.output_data, "w") as json_file:
-            output_json = coicop_output_file.model_dump()
-            json.dump(output_json, json_file, indent=4)
+        # Serialize with pydantic's compiled serializer instead of dumping a
+        # python dict with the json module
+        with open(args.output_data, "w", encoding="utf-8") as json_file:
+            json_file.write(coicop_output_file.model_dump_json(indent=4))
     except Exception as e:
         print(e)
 
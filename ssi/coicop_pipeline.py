@@ -8,6 +8,10 @@ class CoicopPipeline:
         # load the model
         self.model = joblib.load(pipeline_path)
 
+    @property
+    def classes_(self):
+        return self.model.classes_
+
     def __call__(self, inputs: List[str]):
         return self.predict_proba(inputs)
 
@@ -16,14 +20,11 @@ class CoicopPipeline:
 
     def predict_proba(self, inputs: List[str]) -> List[Dict[str, Any]]:
         predictions = self.model.predict_proba(inputs)
-        prediction_labels = []
-        for prediction in predictions:
-            label_predictions = dict()
-            for index, probability in enumerate(prediction):
-                label = self.model.classes_[index]
-                label_predictions[label] = probability
-            prediction_labels.append(label_predictions)
-        return prediction_labels
+        # Convert the labels and probability matrix to python types once,
+        # instead of indexing the numpy arrays per cell
+        labels = self.model.classes_.tolist()
+        return [dict(zip(labels, prediction))
+                for prediction in predictions.tolist()]
 
     def predict_receipt(self, receipt_input: CoicopInputFile) -> CoicopOutputFile:
         receipt_ids = [item.id for item in receipt_input.receipt.items]
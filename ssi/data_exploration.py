@@ -49,7 +49,9 @@ class ProductAnalysis:
                  coicop_level_columns: List[str],
                  year_column: str = "year",
                  year_month_column: str = "year_month",
-                 product_id_columns: List[str] = ["ean_number", "product_id"]):
+                 product_id_columns: List[str] = ["ean_number", "product_id"],
+                 product_description_column: str = "ean_name",
+                 amount_column: str = "count"):
         self.__data_directory = data_directory
         self.__plot_directory = plot_directory
         self.__supermarket_name = supermarket_name
@@ -57,6 +59,8 @@ class ProductAnalysis:
         self.__year_column = year_column
         self.__year_month_column = year_month_column
         self.__product_id_columns = product_id_columns
+        self.__product_description_column = product_description_column
+        self.__amount_column = amount_column
 
     @property
     def data_directory(self):
@@ -90,6 +94,20 @@ class ProductAnalysis:
     def product_id_columns(self):
         return self.__product_id_columns
 
+    @property
+    def product_description_column(self):
+        return self.__product_description_column
+
+    @property
+    def amount_column(self):
+        return self.__amount_column
+
+    @property
+    def columns(self) -> List[str]:
+        """The columns used by the analysis, read only these from the revenue file"""
+        return list(dict.fromkeys(self.coicop_level_columns + [self.year_column, self.year_month_column] +
+                                  self.product_id_columns + [self.product_description_column, self.amount_column]))
+
     def plot_sunburst(self, dataframe: pd.DataFrame, amount_column: str):
         sunburst_filename = os.path.join(
             self.plot_directory, f"products_{self.supermarket_name}_sunburst.html")
@@ -144,16 +162,15 @@ class ProductAnalysis:
                 dataframe, self.supermarket_name, product_id_column, time_column)
 
     def perform_product_analysis_per_coicop_level(self, dataframe: pd.DataFrame, coicop_level: str, product_description_column: str = "ean_name"):
-        coicop_level_values = dataframe[coicop_level].unique()
         os.makedirs(self.wordcloud_plot_directory, exist_ok=True)
         self.plot_wordcloud(dataframe, product_description_column, os.path.join(self.wordcloud_plot_directory,
                                                                                 f"products_{self.supermarket_name}_{coicop_level}_all_wordcloud.png"))
 
         self.retrieve_product_counts(dataframe, coicop_level)
-        for coicop_level_value in coicop_level_values:
-            coicop_level_value_df = filter_coicop_level(
-                dataframe, coicop_level, coicop_level_value)
 
+        # Split the dataframe per coicop value in one pass instead of filtering
+        # it once for every unique value
+        for coicop_level_value, coicop_level_value_df in dataframe.groupby(coicop_level, sort=False):
             wordcloud_filename = os.path.join(
                 self.wordcloud_plot_directory, f"products_{self.supermarket_name}_{coicop_level}_{coicop_level_value}_wordcloud.png")
             self.plot_wordcloud(coicop_level_value_df,
@@ -167,8 +184,8 @@ class ProductAnalysis:
 
         for coicop_level in self.coicop_level_columns:
             self.perform_product_analysis_per_coicop_level(
-                dataframe, coicop_level)
+                dataframe, coicop_level, self.product_description_column)
 
     def analyze_products(self, dataframe: pd.DataFrame):
-        self.plot_sunburst(dataframe, amount_column="count")
+        self.plot_sunburst(dataframe, amount_column=self.amount_column)
         self.perform_product_level_analysis(dataframe)
@@ -34,9 +34,10 @@ class DataLogger:
         coicop_lengths = DataLogger.log_coicop_lengths(
             dataframe, coicop_column)
         coicop_value_dfs = dict()
+        coicop_column_lengths = dataframe[coicop_column].str.len()
         for coicop_length in coicop_lengths.index:
-            counts = dataframe[dataframe[coicop_column].str.len(
-            ) == coicop_length][coicop_column].value_counts()
+            counts = dataframe[coicop_column_lengths ==
+                               coicop_length][coicop_column].value_counts()
             coicop_value_dfs[coicop_length] = counts
         return coicop_value_dfs
 
@@ -46,9 +47,10 @@ class DataLogger:
             dataframe, coicop_column)
 
         coicop_lengths = dict()
+        coicop_column_lengths = dataframe[coicop_column].str.len()
         for coicop_length in coicop_lengths_df.index:
-            coicop_lengths[coicop_length] = dataframe[dataframe[coicop_column].str.len(
-            ) == coicop_length][coicop_column].nunique()
+            coicop_lengths[coicop_length] = dataframe[coicop_column_lengths ==
+                                                      coicop_length][coicop_column].nunique()
 
         return pd.DataFrame(coicop_lengths, index=[0])
 
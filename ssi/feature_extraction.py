@@ -1,14 +1,17 @@
-from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
+from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer, HashingVectorizer, TfidfTransformer
+from sklearn.pipeline import Pipeline
 from scipy.sparse import issparse
 from enum import Enum
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple, Callable
 from .files import get_feature_filename
 import pandas as pd
+import numpy as np
 import pyarrow as pa
 import pyarrow.parquet as pq
 import spacy
 import tqdm
 import math
+import time
 import os
 
 
@@ -41,8 +44,14 @@ class TestFeatureExtractor:
 
 
 class SpacyFeatureExtractor:
-    def __init__(self, model_name):
+    # Only the tokenizer, tok2vec and the static vectors are needed for doc.vector
+    DISABLED_COMPONENTS = ["tagger", "morphologizer", "parser", "senter",
+                           "attribute_ruler", "lemmatizer", "ner"]
+
+    def __init__(self, model_name, batch_size: int = 256, n_process: int = 1):
         self.nlp = spacy.load(model_name)
+        self.batch_size = batch_size
+        self.n_process = n_process
 
     # To speed up: https://github.com/explosion/spaCy/discussions/8402
     def fit(self, X, y, **fit_params):
@@ -53,42 +62,69 @@ class SpacyFeatureExtractor:
 
     def fit_transform(self, X, y=None, **fit_params):
         # We only need spacy to tokenize the text and return the word vectors
-        return [doc.vector
-                for doc in self.nlp.pipe(X, disable=["tagger", "parser", "ner"])]
+        docs = self.nlp.pipe(X, batch_size=self.batch_size, n_process=self.n_process,
+                             disable=SpacyFeatureExtractor.DISABLED_COMPONENTS)
+        doc_vectors = [doc.vector for doc in docs]
+        # Models without static vectors return an empty vector for an empty
+        # text, those rows are left as zeros
+        vector_length = max((doc_vector.shape[0]
+                            for doc_vector in doc_vectors), default=0)
+        vectors = np.zeros((len(doc_vectors), vector_length), dtype=np.float32)
+        for index, doc_vector in enumerate(doc_vectors):
+            if doc_vector.shape[0]:
+                vectors[index] = doc_vector
+        return vectors
+
+
+def hashing_tfidf_vectorizer(analyzer: str, ngram_range: Tuple[int, int], n_features: int) -> Pipeline:
+    """Creates a tf-idf vectorizer that hashes n-grams instead of building a vocabulary
+
+    The hashing vectorizer is stateless, so no vocabulary dictionary has to be
+    built and kept in memory, and the same n-gram always maps to the same column.
+    """
+    return Pipeline([
+        ('hashing', HashingVectorizer(analyzer=analyzer, ngram_range=ngram_range,
+                                      n_features=n_features, alternate_sign=False, norm=None)),
+        ('tfidf', TfidfTransformer())
+    ])
 
 
 class FeatureExtractorFactory:
     def __init__(self):
-        self._feature_extractors = None
+        self._feature_extractor_builders = None
+        self._feature_extractors = dict()
 
     @property
-    def feature_extractors(self) -> Dict[FeatureExtractorType, object]:
-        if not self._feature_extractors:
-            self._feature_extractors = {
-                FeatureExtractorType.test_extractor: TestFeatureExtractor(),
-                FeatureExtractorType.count_vectorizer: CountVectorizer(analyzer='word', token_pattern=r'\w{2,}', max_features=5000),
-                FeatureExtractorType.tfidf_word: TfidfVectorizer(analyzer='word', token_pattern=r'\w{2,}', max_features=5000),
-                FeatureExtractorType.tfidf_char: TfidfVectorizer(analyzer='char', ngram_range=(2, 3), max_features=5000),
-                FeatureExtractorType.tfidf_char34: TfidfVectorizer(analyzer='char', ngram_range=(3, 4), max_features=5000),
-                FeatureExtractorType.count_char: CountVectorizer(analyzer='char', max_features=5000),
-                FeatureExtractorType.spacy_nl_sm: SpacyFeatureExtractor('nl_core_news_sm'),
-                FeatureExtractorType.spacy_nl_md: SpacyFeatureExtractor('nl_core_news_md'),
-                FeatureExtractorType.spacy_nl_lg: SpacyFeatureExtractor(
+    def feature_extractor_builders(self) -> Dict[FeatureExtractorType, Callable[[], object]]:
+        # Extractors are only built when requested, loading a spacy model is expensive
+        if not self._feature_extractor_builders:
+            self._feature_extractor_builders = {
+                FeatureExtractorType.test_extractor: lambda: TestFeatureExtractor(),
+                FeatureExtractorType.count_vectorizer: lambda: CountVectorizer(analyzer='word', token_pattern=r'\w{2,}', max_features=5000),
+                FeatureExtractorType.tfidf_word: lambda: TfidfVectorizer(analyzer='word', token_pattern=r'\w{2,}', max_features=5000),
+                FeatureExtractorType.tfidf_char: lambda: hashing_tfidf_vectorizer(analyzer='char', ngram_range=(2, 3), n_features=5000),
+                FeatureExtractorType.tfidf_char34: lambda: hashing_tfidf_vectorizer(analyzer='char', ngram_range=(3, 4), n_features=5000),
+                FeatureExtractorType.count_char: lambda: CountVectorizer(analyzer='char', max_features=5000),
+                FeatureExtractorType.spacy_nl_sm: lambda: SpacyFeatureExtractor('nl_core_news_sm'),
+                FeatureExtractorType.spacy_nl_md: lambda: SpacyFeatureExtractor('nl_core_news_md'),
+                FeatureExtractorType.spacy_nl_lg: lambda: SpacyFeatureExtractor(
                     'nl_core_news_lg')
             }
-        return self._feature_extractors
+        return self._feature_extractor_builders
 
     @property
     def feature_extractor_types(self):
         return [feature_extractor_type
-                for feature_extractor_type in self.feature_extractors.keys()
+                for feature_extractor_type in self.feature_extractor_builders.keys()
                 if feature_extractor_type != FeatureExtractorType.test_extractor]
 
     def create_feature_extractor(self, feature_extractor_type: FeatureExtractorType):
-        if feature_extractor_type in self.feature_extractors:
-            return self.feature_extractors[feature_extractor_type]
-        else:
+        if feature_extractor_type not in self.feature_extractor_builders:
             raise ValueError("Invalid type")
+        if feature_extractor_type not in self._feature_extractors:
+            self._feature_extractors[feature_extractor_type] = self.feature_extractor_builders[feature_extractor_type](
+            )
+        return self._feature_extractors[feature_extractor_type]
 
     def add_feature_vectors(self,
                             dataframe: pd.DataFrame,
@@ -97,34 +133,60 @@ class FeatureExtractorFactory:
                             feature_extractor_type: FeatureExtractorType,
                             filename: str,
                             batch_size: int,
-                            progress_bar: Optional[tqdm.tqdm] = None
+                            progress_bar: Optional[tqdm.tqdm] = None,
+                            row_group_bytes: int = 128 << 20
                             ):
         feature_extractor = self.create_feature_extractor(
             feature_extractor_type)
 
         pq_writer = None
+        # Encoded batches are buffered and written together once they take up
+        # row_group_bytes, so small batches don't each become a row group. The
+        # vectors are dense, so the threshold is on bytes and not on rows
+        buffered_tables = []
+        buffered_bytes = 0
 
         # Create directory if it does not exist
         os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+        # Convert to arrow once, batches are zero-copy slices of this table
+        dataframe_table = pa.Table.from_pandas(dataframe)
+        last_description_time = None
         for i in range(0, len(dataframe), batch_size):
-            if progress_bar:
+            # Don't redraw the progress bar for every batch, at most twice a second
+            if progress_bar and (last_description_time is None or time.monotonic() - last_description_time >= 0.5):
                 progress_bar.set_description(
                     f"Encoding batch {i // batch_size} out of {math.ceil(len(dataframe) / batch_size)} for {feature_extractor_type}")
-
-            batch_df = dataframe.iloc[i:i+batch_size].copy()
-            vectors = feature_extractor.fit_transform(batch_df[source_column])
-
-            batch_df[destination_column] = list(
-                vectors.toarray()) if issparse(vectors) else list(vectors)
-
-            table = pa.Table.from_pandas(batch_df)
+                last_description_time = time.monotonic()
+
+            vectors = feature_extractor.fit_transform(
+                dataframe[source_column].iloc[i:i+batch_size])
+            vectors = vectors.toarray() if issparse(vectors) else vectors
+            # Single precision is plenty for the features and halves the file size
+            if isinstance(vectors, np.ndarray) and np.issubdtype(vectors.dtype, np.floating):
+                vectors = vectors.astype(np.float32, copy=False)
+            vectors = list(vectors)
+
+            table = dataframe_table.slice(i, batch_size).append_column(
+                destination_column, pa.array(vectors))
             if i == 0:
                 pq_writer = pq.ParquetWriter(filename, table.schema)
-            pq_writer.write_table(table)
+            buffered_tables.append(table)
+            buffered_bytes += table.nbytes
+            if buffered_bytes >= row_group_bytes:
+                self._write_row_group(pq_writer, buffered_tables)
+                buffered_tables = []
+                buffered_bytes = 0
 
         if pq_writer:
+            if buffered_tables:
+                self._write_row_group(pq_writer, buffered_tables)
             pq_writer.close()
 
+    def _write_row_group(self, pq_writer: pq.ParquetWriter, tables: List[pa.Table]):
+        table = pa.concat_tables(tables)
+        pq_writer.write_table(table, row_group_size=table.num_rows)
+
     def extract_features_and_save(self,
                                   dataframe: pd.DataFrame,
                                   source_column: str,
@@ -3,8 +3,10 @@ import os
 
 
 def get_revenue_files_in_folder(data_directory: str, supermarket_name: str, filename_prefix: str = "Omzet") -> List[str]:
-    return [os.path.join(data_directory, filename) for filename in os.listdir(
-        data_directory) if filename.startswith(filename_prefix) and supermarket_name in filename]
+    with os.scandir(data_directory) as entries:
+        return [entry.path
+                for entry in entries
+                if entry.name.startswith(filename_prefix) and supermarket_name in entry.name and entry.is_file()]
 
 
 def get_feature_filename(feature_extractor_type: str, supermarket_name: str) -> str:
@@ -12,9 +14,10 @@ def get_feature_filename(feature_extractor_type: str, supermarket_name: str) ->
 
 
 def get_features_files_in_directory(directory: str, extension: str = ".parquet") -> List[str]:
-    return [filename
-            for filename in os.listdir(directory)
-            if filename.startswith("ssi_") and "_features" in filename and filename.endswith(extension)]
+    with os.scandir(directory) as entries:
+        return [entry.name
+                for entry in entries
+                if entry.name.startswith("ssi_") and entry.name.endswith(extension) and "_features" in entry.name and entry.is_file()]
 
 
 def get_combined_revenue_filename(supermarket_name: str) -> str:
@@ -22,9 +25,10 @@ def get_combined_revenue_filename(supermarket_name: str) -> str:
 
 
 def get_combined_revenue_files_in_directory(directory: str, extension: str = ".parquet") -> List[str]:
-    return [os.path.join(directory, filename)
-            for filename in os.listdir(directory)
-            if filename.startswith("ssi_") and filename.endswith(extension) and "revenue" in filename]
+    with os.scandir(directory) as entries:
+        return [entry.path
+                for entry in entries
+                if entry.name.startswith("ssi_") and entry.name.endswith(extension) and "revenue" in entry.name and entry.is_file()]
 
 
 def get_supermarket_name(filename: str) -> str:
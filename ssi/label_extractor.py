@@ -27,7 +27,7 @@ class MultiColumnLabelExtractor(LabelExtractor):
         return self.__label_columns
 
     def get_labels(self, dataframe: pd.DataFrame):
-        return dataframe[self.label_columns].values.tolist()
+        return dataframe[self.label_columns].to_numpy()
 
 class LabelExtractorFactory:
     def get_label_extractor_for_model(self, model_name: str, coicop_column: Optional[str] = None):
@@ -1,11 +1,46 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import os
+
 
 def predict(pipeline, dataframe: pd.DataFrame, receipt_text_column: str, label_column: str, column_prefix: str = "predict_") -> pd.DataFrame:
-    dataframe[f"{column_prefix}{label_column}"] = pipeline.predict(dataframe[receipt_text_column])
+    # There are only a few hundred distinct labels, as a categorical they are
+    # stored as integer codes and written as a dictionary encoded column. The
+    # categories are the pipeline's classes, so every batch gets the same
+    # dictionary and code type
+    dataframe[f"{column_prefix}{label_column}"] = pd.Categorical(
+        pipeline.predict(dataframe[receipt_text_column]), categories=pipeline.classes_)
     return dataframe
 
 
-def predict_from_file(pipeline, input_filename: str, output_filename: str, label_column: str, column_prefix: str = "predict_"):
-    dataframe = pd.read_parquet(input_filename, engine="pyarrow")
-    dataframe = predict(pipeline, dataframe, label_column, column_prefix)
-    dataframe.to_parquet(output_filename, engine="pyarrow")
\ No newline at end of file
+def predict_from_file(pipeline, input_filename: str, output_filename: str, receipt_text_column: str, label_column: str, column_prefix: str = "predict_", batch_size: int = 100000):
+    # Stream the input file in batches and write each predicted batch as it
+    # is done, so only one batch is kept in memory at a time. Every batch is
+    # written as a single zstd compressed row group; for short-lived
+    # intermediate files feather is faster to read back.
+    input_file = pq.ParquetFile(input_filename, memory_map=True)
+    prediction_column = f"{column_prefix}{label_column}"
+    # The output schema is the input schema plus the prediction column, so the
+    # column types don't depend on the values in the first batch
+    prediction_field = pa.field(prediction_column,
+                                pa.array(pd.Categorical([], categories=pipeline.classes_)).type)
+    schema = input_file.schema_arrow.append(prediction_field)
+
+    # Write to a temporary file that only replaces output_filename once every
+    # batch is written, so a failed prediction leaves no truncated output
+    temporary_filename = f"{output_filename}.tmp"
+    try:
+        with pq.ParquetWriter(temporary_filename, schema,
+                              compression="zstd", compression_level=3, use_dictionary=True) as pq_writer:
+            for batch in input_file.iter_batches(batch_size=batch_size):
+                batch_dataframe = predict(pipeline, batch.to_pandas(),
+                                          receipt_text_column, label_column, column_prefix)
+                table = pa.Table.from_batches([batch]).append_column(
+                    prediction_field, pa.array(batch_dataframe[prediction_column], type=prediction_field.type))
+                pq_writer.write_table(
+                    table, row_group_size=max(batch_size, 64_000))
+        os.replace(temporary_filename, output_filename)
+    finally:
+        if os.path.exists(temporary_filename):
+            os.remove(temporary_filename)
@@ -1,7 +1,9 @@
 from typing import Dict, Any, Optional
 from collections import OrderedDict
 import argparse
-import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as csv
+import pyarrow.parquet as pq
 import os
 import tqdm
 import numpy as np
@@ -45,25 +47,55 @@ def get_columns_to_rename(filename: str) -> Optional[Dict[str, str]]:
     return None
 
 
+def get_header_column_types(filename: str) -> Optional[Dict[str, pa.DataType]]:
+    # Kassa files have a header row, but pyarrow infers column types from the
+    # first block only, so the text and id columns are always read as strings
+    if filename.lower().startswith("kassabon"):
+        return {
+            'Ean': pa.string(),
+            'Kassabon': pa.string(),
+            'RPK_REP_id': pa.string()
+        }
+    return None
+
+
 def convert_to_parquet(input_filename: str,
                        input_file,
                        output_file,
                        delimiter: str = ";",
                        encoding: str = "utf-8",
                        extension: str = ".csv",
-                       decimal: str = ",") -> None:
+                       decimal: str = ",",
+                       block_size: int = 8 << 20) -> None:
+    """ Converts a CSV file to parquet by streaming record batches.
 
+    The CSV file is parsed by pyarrow in blocks of block_size bytes on all
+    cores, and every parsed batch is written to the parquet file directly,
+    so the whole file is never in memory at once. input_file and output_file
+    can be filenames or binary file objects.
+    """
     filename = os.path.basename(input_filename).replace(extension, "")
 
     # Add header names and types to all but kassa files
     header_types = get_column_types(filename)
     header_names = None if not header_types else [
         name for name in header_types.keys()]
-    df = pd.read_csv(input_file, sep=delimiter, engine="pyarrow",
-                     encoding=encoding, decimal=decimal,
-                     names=header_names, dtype=header_types, parse_dates=True)
+    column_types = get_header_column_types(filename) if not header_types else {
+        name: pa.from_numpy_dtype(np.dtype(dtype)) for name, dtype in header_types.items()}
+
+    reader = csv.open_csv(input_file,
+                          read_options=csv.ReadOptions(
+                              column_names=header_names, encoding=encoding, block_size=block_size),
+                          parse_options=csv.ParseOptions(delimiter=delimiter),
+                          convert_options=csv.ConvertOptions(column_types=column_types, decimal_point=decimal))
+
+    columns_to_rename = get_columns_to_rename(filename) or dict()
+    column_names = [columns_to_rename.get(name, name)
+                    for name in reader.schema.names]
+    schema = pa.schema([field.with_name(column_name)
+                        for field, column_name in zip(reader.schema, column_names)])
 
-    columns_to_rename = get_columns_to_rename(filename)
-    if columns_to_rename:
-        df = df.rename(columns=columns_to_rename)
-    df.to_parquet(output_file, engine="pyarrow")
+    with pq.ParquetWriter(output_file, schema, compression="zstd", compression_level=3) as pq_writer:
+        for batch in reader:
+            pq_writer.write_batch(pa.RecordBatch.from_arrays(
+                batch.columns, schema=schema))
@@ -129,5 +129,9 @@ def save_combined_revenue_files(data_directory: str,
     data_logger.log_after_preprocessing(
         combined_df, coicop_column, coicop_level_columns, product_id_column)
 
+    # The combined file is read in large batches by feature extraction and
+    # prediction, so write large zstd compressed row groups
+    pyarrow_options = dict(compression_level=3, row_group_size=1 << 17,
+                           use_dictionary=True, write_statistics=True) if engine == "pyarrow" else dict()
     combined_df.to_parquet(os.path.join(
-        data_directory, output_filename), engine=engine)
+        data_directory, output_filename), engine=engine, compression="zstd", **pyarrow_options)
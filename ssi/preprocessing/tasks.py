@@ -1,6 +1,8 @@
 from luigi.contrib.external_program import ExternalProgramTask
 from parquet import convert_to_parquet
 from preprocess_data import get_revenue_files_in_folder, combine_revenue_files
+from typing import List
+from functools import cached_property
 import pandas as pd
 import luigi
 
@@ -63,15 +65,17 @@ class ConvertCSVToParquet(luigi.Task):
         return CleanCPIFile(input_filename=self.input_filename, output_filename=self.output_filename)
 
     def run(self):
-        with self.input().open('r') as input_file:
-            with self.output().open('w') as output_file:
-                convert_to_parquet(self.input_filename,
-                                   input_file,
-                                   output_file,
-                                   delimiter=self.delimiter,
-                                   encoding=self.encoding,
-                                   extension=self.extension,
-                                   decimal=',')
+        # pyarrow opens the cleaned CSV by path itself, which avoids reading it
+        # through a python file object. The temporary path keeps the parquet
+        # output atomic like LocalTarget.open('w') does
+        with self.output().temporary_path() as output_filename:
+            convert_to_parquet(self.input_filename,
+                               self.input().path,
+                               output_filename,
+                               delimiter=self.delimiter,
+                               encoding=self.encoding,
+                               extension=self.extension,
+                               decimal=',')
 
     def output(self):
         return luigi.LocalTarget(self.output_filename)
@@ -97,13 +101,18 @@ class CombineRevenueFiles(luigi.Task):
     sort_order = luigi.DictParameter(
         default={"bg_number": True, "month": True, "coicop_number": True})
 
-    def requires(self):
-        revenue_files = get_revenue_files_in_folder(
+    @cached_property
+    def revenue_files(self) -> List[str]:
+        # Luigi calls requires() several times while scheduling and reuses task
+        # instances with the same parameters, so list the directory only once
+        return get_revenue_files_in_folder(
             self.input_directory,
             self.store_name,
             self.filename_prefix)
+
+    def requires(self):
         return [ConvertCSVToParquet(input_filename)
-                for input_filename in revenue_files
+                for input_filename in self.revenue_files
                 ]
 
     def output(self):
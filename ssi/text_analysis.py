@@ -5,8 +5,12 @@ import os
 
 
 def clean_text(text: pd.Series) -> pd.Series:
-    """Cleans a text"""
-    return text.str.replace('[^0-9a-zA-Z.,-/ ]', "", regex=True).str.lstrip().str.rstrip().str.lower()
+    """Cleans a text
+
+    The text is converted to arrow backed strings first, so the string
+    operations run as vectorized arrow kernels instead of per row in python.
+    """
+    return text.astype("string[pyarrow]").str.replace('[^0-9a-zA-Z.,-/ ]', "", regex=True).str.lstrip().str.rstrip().str.lower()
 
 
 def series_to_set(series: pd.Series) -> set:
@@ -14,6 +18,32 @@ def series_to_set(series: pd.Series) -> set:
     return set(clean_text(series.drop_duplicates()).tolist())
 
 
+def intersection_length(set1, set2) -> int:
+    """ Computes the size of the intersection between a set and another iterable
+
+    set.intersection already iterates the smaller of two sets, so only empty
+    operands are short-circuited here.
+    """
+    if not set1 or not set2:
+        return 0
+    return len(set1.intersection(set2))
+
+
+def jaccard_index_from_lengths(intersection_length: int, left_length: int, right_length: int) -> float:
+    """ Computes the Jaccard index from precomputed set and intersection sizes """
+    return intersection_length / (left_length + right_length - intersection_length)
+
+
+def dice_coefficient_from_lengths(intersection_length: int, left_length: int, right_length: int) -> float:
+    """ Computes the Dice coefficient from precomputed set and intersection sizes """
+    return 2. * intersection_length / (left_length + right_length)
+
+
+def overlap_coefficient_from_lengths(intersection_length: int, left_length: int, right_length: int) -> float:
+    """ Computes the overlap coefficient from precomputed set and intersection sizes """
+    return intersection_length / min(left_length, right_length)
+
+
 def jaccard_index(set1, set2):
     """ Computes the Jaccard index between two sets
 
@@ -23,9 +53,7 @@ def jaccard_index(set1, set2):
 
     The function will return a value between 0 and 1, where 0 means no overlap and 1 means complete overlap.
     """
-    intersection = len(set1.intersection(set2))
-    union = len(set1) + len(set2) - intersection
-    return intersection / union
+    return jaccard_index_from_lengths(intersection_length(set1, set2), len(set1), len(set2))
 
 
 def dice_coefficient(set1, set2) -> float:
@@ -37,8 +65,7 @@ def dice_coefficient(set1, set2) -> float:
     It ranges from 0 (no overlap) to 1 (complete overlap).
 
     """
-    intersection = len(set1.intersection(set2))
-    return 2. * intersection / (len(set1) + len(set2))
+    return dice_coefficient_from_lengths(intersection_length(set1, set2), len(set1), len(set2))
 
 
 def overlap_coefficient(set1, set2):
@@ -48,8 +75,7 @@ def overlap_coefficient(set1, set2):
     It ranges from 0 (no overlap) to 1 (complete overlap).
 
     """
-    intersection = len(set1.intersection(set2))
-    return intersection / min(len(set1), len(set2))
+    return overlap_coefficient_from_lengths(intersection_length(set1, set2), len(set1), len(set2))
 
 
 def wordcloud_from_set(set1, filename: str):
@@ -188,18 +214,16 @@ def compare_receipt_texts_per_period(dataframe: pd.DataFrame, period_column: str
         period_column)[receipt_text_column].apply(series_to_set)
 
     combined_set = series_to_set(dataframe[receipt_text_column])
+    new_text_columns = dict()
     for period in receipt_texts_per_period.index:
         # Detect which products disappeared and which products are new
-        # Add this as a column to the dataframe
         period_texts = receipt_texts_per_period[period]
         new_texts = combined_set.difference(period_texts)
+        new_text_columns[f"new_text_{period}"] = dataframe[receipt_text_column].isin(
+            new_texts)
 
-        new_texts_column = [True if text in new_texts else False
-                            for text in dataframe[receipt_text_column]]
-
-        dataframe[f"new_text_{period}"] = new_texts_column
-
-    return dataframe
+    # Add all period columns to the dataframe at once instead of one at a time
+    return pd.concat([dataframe, pd.DataFrame(new_text_columns, index=dataframe.index)], axis=1)
 
 
 def compare_receipt_texts(receipt_texts_left: set, receipt_texts_right: set, output_directory: str, supermarket_name: str, name_left: str = "left", name_right: str = "right"):
@@ -214,12 +238,14 @@ def compare_receipt_texts(receipt_texts_left: set, receipt_texts_right: set, out
         output_directory, f"{supermarket_name}_{name_left}_{name_right}_texts_disappeared.txt"))
     write_set_texts_to_file(new_texts, os.path.join(
         output_directory, f"{supermarket_name}_{name_left}_{name_right}_new_texts.txt"))
+    # Reuse the intersection computed above instead of recomputing it per metric
+    lengths = (len(texts_kept_the_same), len(receipt_texts_left), len(receipt_texts_right))
     return {
         "name_left": name_left,
         "name_right": name_right,
-        "jaccard_index": jaccard_index(receipt_texts_left, receipt_texts_right),
-        "dice_coefficient": dice_coefficient(receipt_texts_left, receipt_texts_right),
-        "overlap_coefficient": overlap_coefficient(receipt_texts_left, receipt_texts_right),
+        "jaccard_index": jaccard_index_from_lengths(*lengths),
+        "dice_coefficient": dice_coefficient_from_lengths(*lengths),
+        "overlap_coefficient": overlap_coefficient_from_lengths(*lengths),
         "left_set_length": len(receipt_texts_left),
         "right_set_length": len(receipt_texts_right),
         "intersection_length": len(texts_kept_the_same),
@@ -263,7 +289,8 @@ def analyze_supermarket_receipts(filename: str,
                                  year_column: str = "year",
                                  month_column: str = "year_month",
                                  receipt_text_column: str = "receipt_text"):
-    supermarket_dataframe = pd.read_parquet(filename, engine="pyarrow")
+    supermarket_dataframe = pd.read_parquet(filename, engine="pyarrow", memory_map=True,
+                                            columns=list(dict.fromkeys([year_column, month_column, receipt_text_column])))
     receipts_per_year = compare_receipt_texts_per_year(
         supermarket_dataframe, output_directory, supermarket_name, year_column, receipt_text_column)
     receipts_per_year.to_csv(
@@ -5,7 +5,7 @@ from sklearn.pipeline import Pipeline
 from sklearn.linear_model import LogisticRegression
 from sklearn.utils.discovery import all_estimators
 from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, classification_report, confusion_matrix
+from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, classification_report
 from sklearn.ensemble._voting import _BaseVoting
 from sklearn.ensemble._stacking import _BaseStacking
 from hiclass import LocalClassifierPerParentNode
@@ -16,7 +16,7 @@ import numpy as np
 import tqdm
 import joblib
 import os
-import json
+import orjson
 
 
 class ModelFactory:
@@ -55,6 +55,20 @@ class ModelFactory:
         return models
 
 
+def label_confusion_matrix(y_true: np.array, y_pred: np.array) -> np.ndarray:
+    """Computes the confusion matrix with the labels sorted, like sklearn's confusion_matrix
+
+    The labels are mapped to integer codes once, after which the matrix is a
+    single bincount over the (true, predicted) code pairs.
+    """
+    labels = np.union1d(y_true, y_pred)
+    number_of_labels = len(labels)
+    true_codes = np.searchsorted(labels, y_true)
+    pred_codes = np.searchsorted(labels, y_pred)
+    return np.bincount(number_of_labels * true_codes + pred_codes,
+                       minlength=number_of_labels * number_of_labels).reshape(number_of_labels, number_of_labels)
+
+
 def evaluate(y_true: np.array, y_pred: np.array, suffix: str = "") -> Dict[str, object]:
     return {
         f"accuracy{suffix}": accuracy_score(y_true, y_pred),
@@ -62,7 +76,7 @@ def evaluate(y_true: np.array, y_pred: np.array, suffix: str = "") -> Dict[str,
         f"recall{suffix}": recall_score(y_true, y_pred, average="macro"),
         f"f1{suffix}": f1_score(y_true, y_pred, average="macro"),
         f"classification_report{suffix}": classification_report(y_true, y_pred),
-        f"confusion_matrix{suffix}": confusion_matrix(y_true, y_pred).tolist()
+        f"confusion_matrix{suffix}": label_confusion_matrix(y_true, y_pred).tolist()
     }
 
 
@@ -94,8 +108,11 @@ def train_model(dataframe: pd.DataFrame,
         dataframe, test_size=test_size, stratify=dataframe[coicop_column])
 
     y_train = label_extractor.get_labels(train_df)
-    pipeline.fit(train_df[receipt_text_column],
-                 y_train)
+    # The threading backend lets estimators that parallelize with joblib use
+    # number_of_jobs cores without pickling and copying the training data
+    with joblib.parallel_backend("threading", n_jobs=number_of_jobs):
+        pipeline.fit(train_df[receipt_text_column],
+                     y_train)
 
     y_true = label_extractor.get_labels(test_df)
     y_pred = pipeline.predict(test_df[receipt_text_column])
@@ -103,8 +120,8 @@ def train_model(dataframe: pd.DataFrame,
     if model_type == "hiclass":
         evaluation_dict = []
         for i, coicop_level in enumerate(Constants.COICOP_LEVELS_COLUMNS[::-1]):
-            y_true_level = [y[i] for y in y_true]
-            y_pred_level = [y[i] for y in y_pred]
+            y_true_level = y_true[:, i]
+            y_pred_level = y_pred[:, i]
             evaluation_dict.append(evaluate(y_true_level, y_pred_level, f"_{coicop_level}"))
     else:
         evaluation_dict = evaluate(y_true, y_pred)
@@ -123,7 +140,8 @@ def train_model_with_feature_extractors(input_filename: str,
                                         number_of_jobs: int = -1,
                                         verbose: bool = False
                                         ):
-    dataframe = pd.read_parquet(input_filename, engine="pyarrow")
+    dataframe = pd.read_parquet(
+        input_filename, engine="pyarrow", memory_map=True)
 
     progress_bar = tqdm.tqdm(feature_extractors)
     for feature_extractor in progress_bar:
@@ -136,14 +154,18 @@ def train_model_with_feature_extractors(input_filename: str,
             output_path, f"{model_type.lower()}_{feature_extractor}.pipeline")
         progress_bar.set_description(
             f"Saving model {model_type.lower()} with {feature_extractor} to {model_path}")
-        joblib.dump(trained_pipeline, model_path)
+        # lz4 is nearly as fast as an uncompressed write and protocol 5 pickles
+        # numpy buffers without copying them into the pickle stream
+        joblib.dump(trained_pipeline, model_path,
+                    compress=("lz4", 3), protocol=5)
 
         evaluation_path = os.path.join(
             output_path, f"{model_type.lower()}_{feature_extractor}.evaluation.json")
         progress_bar.set_description(
             f"Saving evaluation {model_type.lower()} with {feature_extractor} to {evaluation_path}")
-        with open(evaluation_path, "w") as evaluation_file:
-            json.dump(evaluate_dict, evaluation_file)
+        with open(evaluation_path, "wb") as evaluation_file:
+            evaluation_file.write(orjson.dumps(
+                evaluate_dict, option=orjson.OPT_SERIALIZE_NUMPY))
 
 
 def train_models(input_filename: str,
@@ -0,0 +1,40 @@
+from ssi.coicop_pipeline import CoicopPipeline
+from sklearn.pipeline import Pipeline
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.linear_model import LogisticRegression
+from test_utils import get_test_path
+import unittest
+import joblib
+import os
+
+
+class CoicopPipelineTest(unittest.TestCase):
+    def setUp(self) -> None:
+        os.makedirs(get_test_path(), exist_ok=True)
+        self.pipeline_path = get_test_path("test.pipeline")
+        model = Pipeline([
+            ('features', CountVectorizer()),
+            ('classifier', LogisticRegression())
+        ])
+        model.fit(["melk halfvol", "volle melk", "jonge kaas", "oude kaas"],
+                  ["011410", "011410", "011420", "011420"])
+        joblib.dump(model, self.pipeline_path)
+
+    def tearDown(self) -> None:
+        if os.path.exists(self.pipeline_path):
+            os.remove(self.pipeline_path)
+
+    def test_predict_proba_returns_probability_per_label(self):
+        pipeline = CoicopPipeline(self.pipeline_path)
+        inputs = ["melk", "kaas", "brood"]
+        predictions = pipeline.predict_proba(inputs)
+        expected_probabilities = pipeline.model.predict_proba(inputs)
+
+        self.assertEqual(len(inputs), len(predictions))
+        for prediction, expected in zip(predictions, expected_probabilities):
+            self.assertEqual(["011410", "011420"], list(prediction.keys()))
+            self.assertEqual(expected.tolist(), list(prediction.values()))
+
+    def test_classes_are_the_model_classes(self):
+        pipeline = CoicopPipeline(self.pipeline_path)
+        self.assertEqual(["011410", "011420"], pipeline.classes_.tolist())
@@ -1,5 +1,5 @@
 from ssi.synthetic_data import generate_fake_data_with_coicop_levels
-from ssi.data_exploration import filter_coicop_level, get_product_counts_per_time, get_product_counts_per_category_and_time
+from ssi.data_exploration import filter_coicop_level, get_product_counts_per_time, get_product_counts_per_category_and_time, ProductAnalysis
 from ssi.constants import Constants
 import pandas as pd
 import unittest
@@ -86,3 +86,11 @@ class DataExplorationTest(unittest.TestCase):
             dataframe, "year_month", "product_id", "coicop_division")
 
         self.assertTrue(expected_dataframe.equals(counts_per_year_df))
+
+    def test_product_analysis_columns(self):
+        product_analysis = ProductAnalysis(data_directory="data",
+                                           plot_directory="plots",
+                                           supermarket_name="supermarket",
+                                           coicop_level_columns=Constants.COICOP_LEVELS_COLUMNS)
+        self.assertEqual(Constants.COICOP_LEVELS_COLUMNS + ["year", "year_month", "ean_number", "product_id", "ean_name", "count"],
+                         product_analysis.columns)
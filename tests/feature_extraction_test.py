@@ -1,9 +1,14 @@
 from ssi.feature_extraction import FeatureExtractorFactory, FeatureExtractorType, SpacyFeatureExtractor
 from ssi.synthetic_data import generate_fake_revenue_data
 from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
+from sklearn.pipeline import Pipeline
 from test_utils import get_test_path
 import unittest
 import pandas as pd
+import numpy as np
+import pyarrow.parquet as pq
+import tempfile
+import spacy
 
 
 class FeatureExtractionTest(unittest.TestCase):
@@ -33,9 +38,9 @@ class FeatureExtractionTest(unittest.TestCase):
         self.assertTrue(isinstance(factory.create_feature_extractor(FeatureExtractorType.tfidf_word),
                                    TfidfVectorizer))
         self.assertTrue(isinstance(factory.create_feature_extractor(FeatureExtractorType.tfidf_char),
-                                   TfidfVectorizer))
+                                   Pipeline))
         self.assertTrue(isinstance(factory.create_feature_extractor(FeatureExtractorType.tfidf_char34),
-                                   TfidfVectorizer))
+                                   Pipeline))
         self.assertTrue(isinstance(factory.create_feature_extractor(FeatureExtractorType.count_char),
                                    CountVectorizer))
         self.assertTrue(isinstance(factory.create_feature_extractor(FeatureExtractorType.spacy_nl_sm),
@@ -45,6 +50,13 @@ class FeatureExtractionTest(unittest.TestCase):
         self.assertTrue(isinstance(factory.create_feature_extractor(FeatureExtractorType.spacy_nl_lg),
                                    SpacyFeatureExtractor))
 
+    def test_create_feature_extractor_returns_cached_instance(self):
+        factory = FeatureExtractorFactory()
+        self.assertIs(factory.create_feature_extractor(FeatureExtractorType.count_vectorizer),
+                      factory.create_feature_extractor(FeatureExtractorType.count_vectorizer))
+        self.assertIsNot(factory.create_feature_extractor(FeatureExtractorType.count_vectorizer),
+                         factory.create_feature_extractor(FeatureExtractorType.count_char))
+
     def test_add_feature_vectors(self):
         dataframe = generate_fake_revenue_data(100, 2018, 2021)
         factory = FeatureExtractorFactory()
@@ -73,3 +85,57 @@ class FeatureExtractionTest(unittest.TestCase):
         for column in dataframe.columns:
             self.assertTrue(expected_feature_df[column].equals(
                 feature_df[column]), f"Column {column} is not equal")
+
+    def test_extract_features_and_save_stores_float_features_as_float32(self):
+        dataframe = generate_fake_revenue_data(100, 2018, 2021)
+        factory = FeatureExtractorFactory()
+
+        test_path = get_test_path("test_float32.parquet")
+
+        factory.extract_features_and_save(
+            dataframe, "coicop_name", "tfidf_features", test_path, FeatureExtractorType.tfidf_word, batch_size=30)
+
+        feature_df = pd.read_parquet(test_path, engine="pyarrow")
+
+        self.assertEqual(100, len(feature_df))
+        self.assertEqual(np.float32, feature_df["tfidf_features"].iloc[0].dtype)
+
+    def test_add_feature_vectors_buffers_batches_into_row_groups(self):
+        dataframe = generate_fake_revenue_data(100, 2018, 2021)
+        factory = FeatureExtractorFactory()
+
+        test_path = get_test_path("test_row_groups.parquet")
+
+        # All batches fit in the default byte threshold, so they form one row group
+        factory.add_feature_vectors(dataframe, "coicop_name", "cv_features", FeatureExtractorType.test_extractor,
+                                    test_path, batch_size=10)
+        metadata = pq.ParquetFile(test_path).metadata
+        self.assertEqual(1, metadata.num_row_groups)
+        self.assertEqual(100, metadata.row_group(0).num_rows)
+
+        # Every batch exceeds a one byte threshold, so each is flushed on its own
+        factory.add_feature_vectors(dataframe, "coicop_name", "cv_features", FeatureExtractorType.test_extractor,
+                                    test_path, batch_size=10, row_group_bytes=1)
+        metadata = pq.ParquetFile(test_path).metadata
+        self.assertEqual([10] * 10, [metadata.row_group(i).num_rows
+                                     for i in range(metadata.num_row_groups)])
+        feature_df = pd.read_parquet(test_path, engine="pyarrow")
+        self.assertEqual([[i, 0] for i in range(100, 200)],
+                         [features.tolist() for features in feature_df["cv_features"]])
+
+    def test_spacy_feature_extractor_with_empty_text(self):
+        # A blank pipeline with only tok2vec has no static vectors, so an empty
+        # text gets an empty vector while other texts get a tensor mean
+        nlp = spacy.blank("nl")
+        nlp.add_pipe("tok2vec")
+        nlp.initialize()
+        with tempfile.TemporaryDirectory() as model_directory:
+            nlp.to_disk(model_directory)
+            feature_extractor = SpacyFeatureExtractor(model_directory)
+
+        for texts in [["", "melk halfvol"], ["melk halfvol", ""]]:
+            vectors = feature_extractor.fit_transform(texts)
+            self.assertEqual(np.float32, vectors.dtype)
+            self.assertEqual(2, vectors.shape[0])
+            self.assertTrue(vectors.shape[1] > 0)
+            self.assertFalse(vectors[texts.index("")].any())
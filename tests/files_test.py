@@ -8,6 +8,9 @@ class FilesTest(unittest.TestCase):
     def setUp(self) -> None:
         remove_test_files()
 
+    def tearDown(self) -> None:
+        remove_test_files()
+
     def test_get_revenue_files_in_folder(self):
         data_directory = os.path.join(os.getcwd(), "tests", "data")
         os.makedirs(data_directory, exist_ok=True)
@@ -0,0 +1,26 @@
+from ssi.label_extractor import SingleColumnLabelExtractor, MultiColumnLabelExtractor
+import unittest
+import pandas as pd
+import numpy as np
+
+
+class LabelExtractorTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dataframe = pd.DataFrame({
+            "coicop_level_1": ["01", "01", "02"],
+            "coicop_level_2": ["011", "012", "021"],
+            "receipt_text": ["melk", "cola", "bier"]
+        })
+
+    def test_single_column_label_extractor(self):
+        labels = SingleColumnLabelExtractor(
+            "coicop_level_2").get_labels(self.dataframe)
+        self.assertEqual(["011", "012", "021"], labels.tolist())
+
+    def test_multi_column_label_extractor(self):
+        labels = MultiColumnLabelExtractor(
+            ["coicop_level_2", "coicop_level_1"]).get_labels(self.dataframe)
+        self.assertIsInstance(labels, np.ndarray)
+        self.assertEqual((3, 2), labels.shape)
+        self.assertEqual(["011", "012", "021"], labels[:, 0].tolist())
+        self.assertEqual(["01", "01", "02"], labels[:, 1].tolist())
@@ -0,0 +1,72 @@
+from ssi.preprocessing.parquet import convert_to_parquet
+from test_utils import get_test_path
+import unittest
+import pandas as pd
+import numpy as np
+import os
+
+
+class ParquetTest(unittest.TestCase):
+    def setUp(self) -> None:
+        os.makedirs(get_test_path(), exist_ok=True)
+        self.test_files = []
+
+    def tearDown(self) -> None:
+        # Other tests scan the test directory for revenue files
+        for filename in self.test_files:
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def test_convert_to_parquet_with_column_types(self):
+        input_filename = get_test_path("OmzetEans_Lidl_2018.csv")
+        output_filename = get_test_path("OmzetEans_Lidl_2018.parquet")
+        self.test_files += [input_filename, output_filename]
+        with open(input_filename, "w", encoding="utf-8") as csv_file:
+            csv_file.write("1;201801;011410;Melk;1;Zuivel;2;Zuivel;3;0123;Halfvolle melk;1,5;2,0\n"
+                           "2;201802;011420;Kaas;1;Zuivel;2;Zuivel;4;0456;Jonge kaas;10,25;1,0\n")
+
+        convert_to_parquet(input_filename, input_filename, output_filename, block_size=64)
+
+        dataframe = pd.read_parquet(output_filename, engine="pyarrow")
+        self.assertEqual(['bg_number', 'month', 'coicop_number', 'coicop_name', 'isba_number', 'isba_name', 'esba_number',
+                          'esba_name', 'rep_id', 'ean_number', 'ean_name', 'revenue', 'amount'], dataframe.columns.tolist())
+        self.assertEqual(["011410", "011420"], dataframe["coicop_number"].tolist())
+        self.assertEqual(["0123", "0456"], dataframe["ean_number"].tolist())
+        self.assertEqual(np.float32, dataframe["revenue"].dtype)
+        self.assertEqual([1.5, 10.25], dataframe["revenue"].tolist())
+
+    def test_convert_to_parquet_renames_kassabon_columns(self):
+        input_filename = get_test_path("KassabonLidl.csv")
+        output_filename = get_test_path("KassabonLidl.parquet")
+        self.test_files += [input_filename, output_filename]
+        with open(input_filename, "w", encoding="utf-8") as csv_file:
+            csv_file.write("Datum_vanaf;Ean;Kassabon;RPK_REP_id\n"
+                           "2018-01-01;123;MELK HALFVOL;1\n")
+
+        with open(input_filename, "rb") as input_file:
+            convert_to_parquet(input_filename, input_file, output_filename)
+
+        dataframe = pd.read_parquet(output_filename, engine="pyarrow")
+        self.assertEqual(["start_date", "ean_number", "receipt_text", "rep_id"],
+                         dataframe.columns.tolist())
+        self.assertEqual(["MELK HALFVOL"], dataframe["receipt_text"].tolist())
+
+    def test_convert_to_parquet_reads_kassabon_ids_as_strings_across_blocks(self):
+        input_filename = get_test_path("KassabonJumbo.csv")
+        output_filename = get_test_path("KassabonJumbo.parquet")
+        self.test_files += [input_filename, output_filename]
+        rows = [f"2018-01-01;0{i:012d};MELK HALFVOL;{i}" for i in range(500)]
+        rows.append("2018-01-02;onbekend;KAAS JONG;R1")
+        with open(input_filename, "w", encoding="utf-8") as csv_file:
+            csv_file.write("Datum_vanaf;Ean;Kassabon;RPK_REP_id\n")
+            csv_file.write("\n".join(rows) + "\n")
+
+        # The non-numeric ean and rep id are far beyond the first block
+        convert_to_parquet(input_filename, input_filename,
+                           output_filename, block_size=4096)
+
+        dataframe = pd.read_parquet(output_filename, engine="pyarrow")
+        self.assertEqual(501, len(dataframe))
+        self.assertEqual("0000000000000", dataframe["ean_number"].iloc[0])
+        self.assertEqual("onbekend", dataframe["ean_number"].iloc[-1])
+        self.assertEqual("R1", dataframe["rep_id"].iloc[-1])
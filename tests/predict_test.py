@@ -0,0 +1,128 @@
+from ssi.predict import predict_from_file
+from sklearn.pipeline import Pipeline
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.linear_model import LogisticRegression
+from test_utils import get_test_path
+import unittest
+import pandas as pd
+import os
+
+
+class PredictTest(unittest.TestCase):
+    def setUp(self) -> None:
+        os.makedirs(get_test_path(), exist_ok=True)
+        self.pipeline = Pipeline([
+            ('features', CountVectorizer()),
+            ('classifier', LogisticRegression())
+        ])
+        self.pipeline.fit(["melk halfvol", "volle melk", "jonge kaas", "oude kaas"],
+                          ["011410", "011410", "011420", "011420"])
+        self.test_files = []
+
+    def tearDown(self) -> None:
+        for filename in self.test_files:
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def test_predict_from_file_in_batches(self):
+        dataframe = pd.DataFrame({
+            "receipt_text": ["melk", "kaas", "halfvolle melk", "oude kaas", "melk", "kaas", "jonge kaas"],
+            "coicop_number": ["011410", "011420", "011410", "011420", "011410", "011420", "011420"]
+        })
+        input_filename = get_test_path("predict_input.parquet")
+        output_filename = get_test_path("predict_output.parquet")
+        self.test_files += [input_filename, output_filename]
+        dataframe.to_parquet(input_filename, engine="pyarrow")
+
+        predict_from_file(self.pipeline, input_filename, output_filename,
+                          "receipt_text", "coicop_number", batch_size=3)
+
+        predictions = pd.read_parquet(output_filename, engine="pyarrow")
+        self.assertEqual(["receipt_text", "coicop_number", "predict_coicop_number"],
+                         predictions.columns.tolist())
+        self.assertTrue(dataframe.equals(
+            predictions[["receipt_text", "coicop_number"]]))
+        self.assertEqual(self.pipeline.predict(dataframe["receipt_text"]).tolist(),
+                         predictions["predict_coicop_number"].tolist())
+        self.assertEqual("category", predictions["predict_coicop_number"].dtype)
+        self.assertEqual(["011410", "011420"],
+                         predictions["predict_coicop_number"].cat.categories.tolist())
+
+    def test_predict_from_file_with_single_label_batches(self):
+        # Every batch holds one label, the dictionary still has all the classes
+        dataframe = pd.DataFrame({
+            "receipt_text": ["melk", "kaas", "melk"],
+            "coicop_number": ["011410", "011420", "011410"]
+        })
+        input_filename = get_test_path("predict_input_single_label.parquet")
+        output_filename = get_test_path("predict_output_single_label.parquet")
+        self.test_files += [input_filename, output_filename]
+        dataframe.to_parquet(input_filename, engine="pyarrow")
+
+        predict_from_file(self.pipeline, input_filename, output_filename,
+                          "receipt_text", "coicop_number", batch_size=1)
+
+        predictions = pd.read_parquet(output_filename, engine="pyarrow")
+        self.assertEqual(["011410", "011420", "011410"],
+                         predictions["predict_coicop_number"].tolist())
+
+    def test_predict_from_file_with_null_column_in_first_batch(self):
+        dataframe = pd.DataFrame({
+            "receipt_text": ["melk", "kaas", "melk", "kaas"],
+            "ean_name": [None, None, "halfvolle melk", "jonge kaas"]
+        })
+        input_filename = get_test_path("predict_input_nulls.parquet")
+        output_filename = get_test_path("predict_output_nulls.parquet")
+        self.test_files += [input_filename, output_filename]
+        dataframe.to_parquet(input_filename, engine="pyarrow")
+
+        predict_from_file(self.pipeline, input_filename, output_filename,
+                          "receipt_text", "coicop_number", batch_size=2)
+
+        predictions = pd.read_parquet(output_filename, engine="pyarrow")
+        self.assertEqual([None, None, "halfvolle melk", "jonge kaas"],
+                         predictions["ean_name"].tolist())
+        self.assertEqual(["011410", "011420", "011410", "011420"],
+                         predictions["predict_coicop_number"].tolist())
+
+    def test_predict_from_file_leaves_no_output_on_failure(self):
+        class FailingPipeline:
+            classes_ = self.pipeline.classes_
+
+            def __init__(self, pipeline):
+                self.pipeline = pipeline
+                self.number_of_batches = 0
+
+            def predict(self, texts):
+                self.number_of_batches += 1
+                if self.number_of_batches > 1:
+                    raise RuntimeError("prediction failed")
+                return self.pipeline.predict(texts)
+
+        dataframe = pd.DataFrame({"receipt_text": ["melk", "kaas", "melk", "kaas"]})
+        input_filename = get_test_path("predict_input_failure.parquet")
+        output_filename = get_test_path("predict_output_failure.parquet")
+        self.test_files += [input_filename, output_filename]
+        dataframe.to_parquet(input_filename, engine="pyarrow")
+
+        with self.assertRaises(RuntimeError):
+            predict_from_file(FailingPipeline(self.pipeline), input_filename, output_filename,
+                              "receipt_text", "coicop_number", batch_size=2)
+
+        self.assertFalse(os.path.exists(output_filename))
+        self.assertFalse(os.path.exists(f"{output_filename}.tmp"))
+
+    def test_predict_from_file_with_empty_input(self):
+        dataframe = pd.DataFrame({"receipt_text": pd.Series([], dtype=str)})
+        input_filename = get_test_path("predict_input_empty.parquet")
+        output_filename = get_test_path("predict_output_empty.parquet")
+        self.test_files += [input_filename, output_filename]
+        dataframe.to_parquet(input_filename, engine="pyarrow")
+
+        predict_from_file(self.pipeline, input_filename, output_filename,
+                          "receipt_text", "coicop_number")
+
+        predictions = pd.read_parquet(output_filename, engine="pyarrow")
+        self.assertEqual(["receipt_text", "predict_coicop_number"],
+                         predictions.columns.tolist())
+        self.assertEqual(0, len(predictions))
@@ -11,6 +11,12 @@ class TestPreprocessData(unittest.TestCase):
         self.coicop_series = pd.Series([
             "011201", "022312", "123423", "054534", "065645"
         ])
+        self.test_files = []
+
+    def tearDown(self) -> None:
+        for filename in self.test_files:
+            if os.path.exists(filename):
+                os.remove(filename)
 
     def test_split_coicop_returns_full_coicop_number(self):
         self.assertTrue(self.coicop_series.equals(split_coicop(
@@ -246,6 +252,7 @@ class TestPreprocessData(unittest.TestCase):
                 filenames.append(os.path.join(
                     data_directory, f"Omzet_{supermarket_name}_{i}.parquet"))
                 dataframe.to_parquet(filenames[-1])
+                self.test_files.append(filenames[-1])
                 dataframes.append(dataframe)
 
         combined_dataframe = combine_revenue_files(
@@ -277,6 +284,7 @@ class TestPreprocessData(unittest.TestCase):
                 filenames.append(os.path.join(
                     data_directory, f"Omzet_{supermarket_name}_{i}.parquet"))
                 dataframe.to_parquet(filenames[-1])
+                self.test_files.append(filenames[-1])
 
         number_of_files_read = 0
         for i, (supermarket_name, number_of_files) in enumerate(revenue_files.items()):
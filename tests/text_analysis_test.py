@@ -0,0 +1,73 @@
+from ssi.text_analysis import *
+import unittest
+import tempfile
+import pandas as pd
+
+
+class TextAnalysisTest(unittest.TestCase):
+    def test_clean_text(self):
+        texts = pd.Series(["  Melk HALFVOL 1,5L!! ", "Kaas-jong/48+", "AH brood*"])
+        self.assertEqual(["melk halfvol 1,5l", "kaas-jong/48", "ah brood"],
+                         clean_text(texts).tolist())
+
+    def test_series_to_set(self):
+        texts = pd.Series(["Melk", "melk ", "KAAS", "kaas"])
+        self.assertEqual({"melk", "kaas"}, series_to_set(texts))
+
+    def test_intersection_length(self):
+        self.assertEqual(2, intersection_length({"a", "b", "c"}, {"b", "c"}))
+        self.assertEqual(2, intersection_length({"b", "c"}, {"a", "b", "c"}))
+        self.assertEqual(0, intersection_length(set(), {"a", "b"}))
+        self.assertEqual(0, intersection_length({"a", "b"}, set()))
+        self.assertEqual(0, intersection_length({"a"}, {"b"}))
+        self.assertEqual(1, intersection_length({"a", "b", "c"}, ["a"]))
+
+    def test_jaccard_index(self):
+        self.assertEqual(0.5, jaccard_index({"a", "b", "c"}, {"b", "c", "d"}))
+        self.assertEqual(1.0, jaccard_index({"a", "b"}, {"a", "b"}))
+        self.assertEqual(0.0, jaccard_index({"a"}, {"b"}))
+        self.assertEqual(0.0, jaccard_index(set(), {"b"}))
+        self.assertEqual(1 / 3, jaccard_index({"a", "b", "c"}, ["a"]))
+
+    def test_dice_coefficient(self):
+        self.assertEqual(2 / 3, dice_coefficient({"a", "b", "c"}, {"b", "c", "d"}))
+        self.assertEqual(1.0, dice_coefficient({"a", "b"}, {"a", "b"}))
+        self.assertEqual(0.0, dice_coefficient({"a"}, {"b"}))
+
+    def test_overlap_coefficient(self):
+        self.assertEqual(1.0, overlap_coefficient({"a", "b", "c"}, {"b", "c"}))
+        self.assertEqual(0.5, overlap_coefficient({"a", "b"}, {"b", "c", "d"}))
+        self.assertEqual(0.0, overlap_coefficient({"a"}, {"b"}))
+
+    def test_compare_receipt_texts_metrics_match_set_metrics(self):
+        left = {"melk", "brood", "kaas", "appel"}
+        right = {"brood", "kaas", "peer"}
+
+        # compare_receipt_texts writes the text sets to files in the output directory
+        with tempfile.TemporaryDirectory() as output_directory:
+            comparison = compare_receipt_texts(
+                left, right, output_directory, "supermarket")
+
+        self.assertEqual(jaccard_index(left, right), comparison["jaccard_index"])
+        self.assertEqual(dice_coefficient(left, right),
+                         comparison["dice_coefficient"])
+        self.assertEqual(overlap_coefficient(left, right),
+                         comparison["overlap_coefficient"])
+        self.assertEqual(2, comparison["intersection_length"])
+        self.assertEqual(5, comparison["union_length"])
+
+    def test_compare_receipt_texts_per_period(self):
+        dataframe = pd.DataFrame({
+            "period": ["2018", "2018", "2019", "2019"],
+            "receipt_text": ["melk", "kaas", "kaas", "brood"]
+        })
+
+        comparison = compare_receipt_texts_per_period(
+            dataframe, "period", "receipt_text")
+
+        self.assertEqual(["period", "receipt_text", "new_text_2018", "new_text_2019"],
+                         comparison.columns.tolist())
+        self.assertEqual([False, False, False, True],
+                         comparison["new_text_2018"].tolist())
+        self.assertEqual([True, False, False, False],
+                         comparison["new_text_2019"].tolist())
@@ -0,0 +1,17 @@
+from ssi.train_model import label_confusion_matrix
+from sklearn.metrics import confusion_matrix
+import unittest
+import pandas as pd
+import numpy as np
+
+
+class TrainModelTest(unittest.TestCase):
+    def test_label_confusion_matrix_matches_sklearn(self):
+        y_true = pd.Series(["011", "012", "011", "021", "012", "011"])
+        y_pred = np.array(["011", "011", "011", "021", "022", "012"])
+        self.assertEqual(confusion_matrix(y_true, y_pred).tolist(),
+                         label_confusion_matrix(y_true, y_pred).tolist())
+
+    def test_label_confusion_matrix_perfect_prediction(self):
+        y = np.array(["01", "02", "02"])
+        self.assertEqual([[1, 0], [0, 2]], label_confusion_matrix(y, y).tolist())